@@ -1,9 +1,6 @@
 import argparse
-import ast
 import collections
-import configparser
 import errno
-import json
 import logging
 import os
 import sys
@@ -11,11 +8,11 @@ import traceback
 from abc import ABCMeta
 from argparse import Action, ArgumentParser
 from enum import Enum, EnumMeta, IntEnum
-from functools import partial
+from functools import lru_cache, partial
 from pathlib import Path
 from types import MappingProxyType
 from typing import (
-    Any, Callable, Dict, Iterable, Iterator, List, Literal, Mapping,
+    Any, Callable, Dict, FrozenSet, Iterable, Iterator, List, Literal, Mapping,
     MutableMapping, NamedTuple, Optional, Sequence, Set, Tuple, Type, TypeVar,
     Union,
 )
@@ -24,26 +21,30 @@ from typing import (
 ConverterType = Callable[[str], Any]
 NoneType = type(None)
 UnionClass = Union[None, int].__class__
+OptionalBool = Optional[bool]
 EnumType = EnumMeta
 
+if sys.version_info >= (3, 10):
+    from types import UnionType
+    UnionClasses: FrozenSet[Type] = frozenset((UnionClass, UnionType))
+else:
+    UnionClasses = frozenset((UnionClass,))
 
-def read_configs(
-    *paths: Union[str, Path], **kwargs: Any,
+
+ConfigFileKey = Tuple[Path, int, int]
+EMPTY_MAPPING: Mapping[str, Any] = MappingProxyType({})
+NOT_DECLARED = object()
+
+
+@lru_cache(maxsize=128)
+def _read_configs(
+    files: Tuple[ConfigFileKey, ...], options: Tuple[Tuple[str, Any], ...],
 ) -> Tuple[Mapping[str, Any], Tuple[Path, ...]]:
-    kwargs.setdefault("allow_no_value", True)
-    kwargs.setdefault("strict", False)
-    parser = configparser.ConfigParser(**kwargs)
+    # Imported here because most parsers never read any config files
+    import configparser
 
-    filenames = list(
-        map(
-            lambda p: p.resolve(),
-            filter(
-                lambda p: p.is_file(),
-                map(lambda x: Path(x).expanduser(), paths),
-            ),
-        ),
-    )
-    config_paths = parser.read(filenames)
+    parser = configparser.ConfigParser(**dict(options))
+    config_paths = parser.read([path for path, _, _ in files])
 
     result: Dict[str, Union[str, Dict[str, str]]] = dict(
         parser.items(parser.default_section, raw=True),
@@ -56,6 +57,37 @@ def read_configs(
     return result, tuple(map(Path, config_paths))
 
 
+def read_configs(
+    *paths: Union[str, Path], **kwargs: Any,
+) -> Tuple[Mapping[str, Any], Tuple[Path, ...]]:
+    kwargs.setdefault("allow_no_value", True)
+    kwargs.setdefault("strict", False)
+
+    # The parsed content is cached by path, modification time and size,
+    # so the same files are not parsed again for every parser instance.
+    files: List[ConfigFileKey] = []
+    for path in map(lambda x: Path(x).expanduser(), paths):
+        if not path.is_file():
+            continue
+        stat = path.stat()
+        files.append((path.resolve(), stat.st_mtime_ns, stat.st_size))
+
+    key = (tuple(files), tuple(sorted(kwargs.items())))
+    try:
+        hash(key)
+    except TypeError:
+        # Unhashable ConfigParser options, e.g. a converters dict
+        result, config_paths = _read_configs.__wrapped__(*key)
+    else:
+        result, config_paths = _read_configs(*key)
+
+    # Callers may modify the result, do not let it leak into the cache
+    return {
+        name: dict(value) if isinstance(value, dict) else value
+        for name, value in result.items()
+    }, config_paths
+
+
 class SecretString(str):
     """
     The class mimics the string, with one important difference.
@@ -160,6 +192,8 @@ class INIConfigAction(ConfigAction):
 
 class JSONConfigAction(ConfigAction):
     def parse_file(self, file: Path) -> Any:
+        import json
+
         with file.open("r") as fp:
             return json.load(fp)
 
@@ -358,10 +392,10 @@ class AbstractParser:
     __parent__: Union["Parser", None] = None
 
     def _get_chain(self) -> Iterator["AbstractParser"]:
-        yield self
-        if self.__parent__ is None:
-            return
-        yield from self.__parent__._get_chain()
+        parser: Optional[AbstractParser] = self
+        while parser is not None:
+            yield parser
+            parser = parser.__parent__
 
     def __call__(self) -> Any:
         raise NotImplementedError()
@@ -376,10 +410,31 @@ def parse_bool(value: str) -> bool:
     return value.lower() in TEXT_TRUE_VALUES
 
 
+@lru_cache(maxsize=4096)
+def parse_sequence(value: str) -> Tuple[Any, ...]:
+    # The same config or environment value is parsed for every parser
+    # which declares the argument
+    import ast
+    import json
+
+    try:
+        # The C JSON decoder handles the common "[1, 2, 3]" form, python
+        # literals like sets and tuples fall back to ast.literal_eval
+        return tuple(json.loads(value))
+    except ValueError:
+        return tuple(ast.literal_eval(value))
+
+
 def unwrap_optional(typespec: Any) -> Optional[Any]:
-    if typespec.__class__ != UnionClass:
+    if typespec.__class__ not in UnionClasses:
         return None
+    return _unwrap_union(typespec)
+
 
+@lru_cache(maxsize=None)
+def _unwrap_union(typespec: Any) -> Any:
+    # typing caches Union objects, so the same Optional[...] is passed here
+    # for every class that declares it
     union_args = [a for a in typespec.__args__ if a is not NoneType]
 
     if len(union_args) != 1:
@@ -402,7 +457,7 @@ def _make_action_true_argument(
             kw["action"] = Actions.STORE_FALSE
         else:
             raise TypeError(f"Can not set default {default!r} for bool")
-    elif kind == Optional[bool]:
+    elif kind == OptionalBool:
         kw["action"] = Actions.STORE
         kw["type"] = parse_bool
         kw["default"] = None
@@ -410,7 +465,40 @@ def _make_action_true_argument(
 
 
 def _type_is_bool(kind: Type) -> bool:
-    return kind is bool or kind == Optional[bool]
+    # Plain classes are the common case, skip comparing them with the Union
+    if isinstance(kind, type):
+        return kind is bool
+    return kind == OptionalBool
+
+
+def _is_inferred_type(argument: TypedArgument, kind: Any) -> bool:
+    if argument.type is None or argument.converter is not None:
+        return False
+    if argument.type == kind:
+        return True
+    try:
+        return argument.type == unwrap_optional(kind)
+    except TypeError:
+        return False
+
+
+class ArgumentDescriptor:
+    """
+    Class attribute for the declared argument. Returns the argument
+    declaration on class access and raises AttributeError on instance
+    access until the parsed value is stored in the instance ``__dict__``.
+    """
+
+    __slots__ = ("name", "argument")
+
+    def __init__(self, name: str, argument: TypedArgument):
+        self.name = name
+        self.argument = argument
+
+    def __get__(self, instance: Any, owner: Type) -> Any:
+        if instance is None:
+            return self.argument
+        raise AttributeError(f"Attribute {self.name!r} was not parsed")
 
 
 class Meta(ABCMeta):
@@ -418,29 +506,74 @@ class Meta(ABCMeta):
         mcs, name: str, bases: Tuple[Type["Meta"], ...],
         attrs: Dict[str, Any],
     ) -> "Meta":
-        annotations = merge_annotations(
-            attrs.get("__annotations__", {}), *bases,
-        )
+        own_annotations = attrs.get("__annotations__", {})
+        base_annotations = merge_annotations({}, *bases)
+        annotations = merge_annotations(own_annotations, *bases)
+        attrs["__annotations__"] = annotations
+
+        arguments: Dict[str, TypedArgument] = {}
+        argument_groups: Dict[str, AbstractGroup] = {}
+        subparsers: Dict[str, AbstractParser] = {}
+        # Values declared for the arguments built from annotations, so a
+        # subclass can build them again for a different annotation
+        implicit: Dict[str, Any] = {}
+
+        # Bases are already flattened, so their declarations are reused
+        # instead of being built again from the merged annotations.
+        # Reversed, so the earlier bases win as they do in the MRO.
+        for base in reversed(bases):
+            base_arguments = getattr(base, "__arguments__", {})
+            base_implicit = getattr(base, "__implicit_arguments__", {})
+            arguments.update(base_arguments)
+            argument_groups.update(getattr(base, "__argument_groups__", {}))
+            subparsers.update(getattr(base, "__subparsers__", {}))
+            for key in base_arguments:
+                if key in base_implicit:
+                    implicit[key] = base_implicit[key]
+                else:
+                    implicit.pop(key, None)
+        inherited = frozenset(arguments) | frozenset(argument_groups)
 
-        arguments = {}
-        argument_groups = {}
-        subparsers = {}
         for key, kind in annotations.items():
             if key.startswith("_"):
                 continue
 
-            try:
-                argument = deep_getattr(key, attrs, *bases)
-            except KeyError:
+            if (
+                key in inherited and
+                key not in attrs and
+                key not in own_annotations
+            ):
+                continue
+
+            if key not in attrs and key in implicit:
+                # Built from the base annotation, so it is built again
+                # from the value declared in the base
+                argument = implicit.pop(key)
+            else:
+                try:
+                    argument = deep_getattr(key, attrs, *bases)
+                except KeyError:
+                    argument = NOT_DECLARED
+                implicit.pop(key, None)
+
+            declared = argument
+            if argument is NOT_DECLARED:
                 argument = None
                 if kind is bool:
                     argument = False
 
+            if key not in attrs and isinstance(argument, TypedArgument):
+                # The base declaration is shared, so a re-annotated field
+                # gets its own copy, typed by the new annotation when the
+                # base type was only inferred from the base annotation
+                overrides: Dict[str, Any] = {}
+                if _is_inferred_type(argument, base_annotations.get(key)):
+                    overrides["type"] = None
+                argument = argument.copy(**overrides)
+
             if not isinstance(
                 argument, (TypedArgument, AbstractGroup, AbstractParser),
             ):
-                attrs[key] = ...
-
                 is_required = argument is None or argument is Ellipsis
 
                 if _type_is_bool(kind):
@@ -454,10 +587,14 @@ class Meta(ABCMeta):
                     argument = TypedArgument(
                         type=kind, default=argument, required=is_required,
                     )
+                implicit[key] = declared
 
             if isinstance(argument, TypedArgument):
                 if argument.type is None and argument.converter is None:
-                    if kind.__class__.__module__ == "typing":
+                    if (
+                        kind.__class__.__module__ == "typing" or
+                        kind.__class__ in UnionClasses
+                    ):
                         kind = unwrap_optional(kind)
                         argument.default = None
                     argument.type = kind
@@ -474,14 +611,29 @@ class Meta(ABCMeta):
 
             if isinstance(value, TypedArgument):
                 arguments[key] = value
+                implicit.pop(key, None)
             elif isinstance(value, AbstractGroup):
                 argument_groups[key] = value
             elif isinstance(value, AbstractParser):
                 subparsers[key] = value
 
-        attrs["__arguments__"] = MappingProxyType(arguments)
-        attrs["__argument_groups__"] = MappingProxyType(argument_groups)
-        attrs["__subparsers__"] = MappingProxyType(subparsers)
+        for key, argument in arguments.items():
+            attrs[key] = ArgumentDescriptor(key, argument)
+
+        # Most groups and subparsers declare no nested groups or subparsers
+        attrs["__arguments__"] = (
+            MappingProxyType(arguments) if arguments else EMPTY_MAPPING
+        )
+        attrs["__argument_groups__"] = (
+            MappingProxyType(argument_groups)
+            if argument_groups else EMPTY_MAPPING
+        )
+        attrs["__subparsers__"] = (
+            MappingProxyType(subparsers) if subparsers else EMPTY_MAPPING
+        )
+        attrs["__implicit_arguments__"] = (
+            MappingProxyType(implicit) if implicit else EMPTY_MAPPING
+        )
         cls = super().__new__(mcs, name, bases, attrs)
         return cls
 
@@ -490,17 +642,7 @@ class Base(metaclass=Meta):
     __arguments__: Mapping[str, TypedArgument]
     __argument_groups__: Mapping[str, "Group"]
     __subparsers__: Mapping[str, "Parser"]
-
-    def __getattribute__(self, item: str) -> Any:
-        value = super().__getattribute__(item)
-        if item.startswith("_"):
-            return value
-
-        if item in self.__arguments__:
-            class_value = getattr(self.__class__, item, None)
-            if value is class_value:
-                raise AttributeError(f"Attribute {item!r} was not parsed")
-        return value
+    __implicit_arguments__: Mapping[str, Any]
 
     def __repr__(self) -> str:
         return (
@@ -530,7 +672,11 @@ class Group(AbstractGroup, Base):
         self._prefix: Optional[str] = prefix
         self._title: Optional[str] = title
         self._description: Optional[str] = description
-        self._defaults: Mapping[str, Any] = MappingProxyType(defaults or {})
+        # Copied, so the shared group does not follow later changes of the
+        # caller's dict
+        self._defaults: Mapping[str, Any] = (
+            MappingProxyType(dict(defaults)) if defaults else EMPTY_MAPPING
+        )
 
 
 ParserType = TypeVar("ParserType", bound="Parser")
@@ -565,24 +711,20 @@ class Parser(AbstractParser, Base):
             ).strip()
 
         if argument.env_var is not None:
-            default = kwargs.get("default")
-            kwargs["default"] = os.getenv(argument.env_var, default)
-
-            if kwargs["default"] and argument.is_nargs:
-                kwargs["default"] = list(
-                    map(
-                        argument.type or str,
-                        ast.literal_eval(kwargs["default"]),
-                    ),
+            default = os.getenv(argument.env_var, kwargs.get("default"))
+
+            # Non-string defaults came from the declaration and are used as is
+            if default and isinstance(default, str) and argument.is_nargs:
+                default = list(
+                    map(argument.type or str, parse_sequence(default)),
                 )
 
+            kwargs["default"] = default
+
             kwargs["help"] = (
                 f"{kwargs.get('help', '')} [ENV: {argument.env_var}]"
             ).strip()
 
-            if argument.env_var in os.environ:
-                self._used_env_vars.add(argument.env_var)
-
         if kwargs.get("default"):
             kwargs["required"] = False
 
@@ -607,26 +749,35 @@ class Parser(AbstractParser, Base):
         super().__init__()
         self.current_subparsers = ()
         self._config_files = config_files
-        self._config, filenames = read_configs(*config_files)
+        self._config: Mapping[str, Any] = {}
 
-        self._epilog = kwargs.pop("epilog", "")
+        epilog = [kwargs.pop("epilog", None) or ""]
 
         if config_files:
+            self._config, filenames = read_configs(*config_files)
+
             # If not config files, we don't need to add any to the epilog
-            self._epilog += self.HELP_APPENDIX_PREAMBLE.format(
-                configs=repr(config_files),
+            epilog.append(
+                self.HELP_APPENDIX_PREAMBLE.format(configs=repr(config_files)),
             )
 
             if filenames:
-                self._epilog += self.HELP_APPENDIX_CURRENT.format(
-                    num_existent=len(filenames),
-                    existent=repr(list(map(str, filenames))),
+                epilog.append(
+                    self.HELP_APPENDIX_CURRENT.format(
+                        num_existent=len(filenames),
+                        existent=repr(list(map(str, filenames))),
+                    ),
                 )
-            self._epilog += self.HELP_APPENDIX_END
+            epilog.append(self.HELP_APPENDIX_END)
+
+        self._epilog = "".join(epilog)
 
         self._auto_env_var_prefix = auto_env_var_prefix
         self._parser_kwargs = kwargs
         self._used_env_vars: Set[str] = set()
+        self._parser_cache: Optional[
+            Tuple[Dict[str, Optional[str]], ArgumentParser, DestinationsType]
+        ] = None
 
     @property
     def current_subparser(self) -> Optional["AbstractParser"]:
@@ -651,6 +802,47 @@ class Parser(AbstractParser, Base):
 
         return parser, destinations
 
+    @staticmethod
+    def _get_env_state(
+        destinations: DestinationsType,
+    ) -> Dict[str, Optional[str]]:
+        return {
+            argument.env_var: os.getenv(argument.env_var)
+            for values in destinations.values()
+            for _, _, argument, _ in values
+            if argument is not None and argument.env_var is not None
+        }
+
+    def _bind_subparsers(self) -> None:
+        for subparser in self.__subparsers__.values():
+            subparser.__parent__ = self
+            subparser._bind_subparsers()
+
+    def _get_parser(self) -> Tuple[ArgumentParser, DestinationsType]:
+        # Defaults and required flags are taken from the environment when
+        # the parser is built, so the cached parser is only reused while
+        # the environment variables it was built from are unchanged.
+        if self._parser_cache is not None:
+            env_state, parser, destinations = self._parser_cache
+            if env_state == self._get_env_state(destinations):
+                # Subparser instances are shared between the parser
+                # instances of the same class
+                self._bind_subparsers()
+            else:
+                self._parser_cache = None
+
+        if self._parser_cache is None:
+            parser, destinations = self._make_parser()
+            env_state = self._get_env_state(destinations)
+            self._parser_cache = (env_state, parser, destinations)
+
+        # Collected on every call, sanitize_env might have removed
+        # variables which were set again since the parser was built
+        self._used_env_vars = {
+            name for name, value in env_state.items() if value is not None
+        }
+        return parser, destinations
+
     def _fill_arguments(
         self, destinations: DestinationsType, parser: ArgumentParser,
     ) -> None:
@@ -732,6 +924,9 @@ class Parser(AbstractParser, Base):
         )
 
         for subparser_name, subparser in self.__subparsers__.items():
+            # Bound first, nested subparsers store the whole chain while
+            # their parsers are built
+            subparser.__parent__ = self
             current_parser, subparser_dests = (
                 subparser._make_parser(
                     subparsers.add_parser(
@@ -739,7 +934,6 @@ class Parser(AbstractParser, Base):
                     ),
                 )
             )
-            subparser.__parent__ = self
             current_parser.set_defaults(
                 current_subparsers=tuple(subparser._get_chain()),
             )
@@ -764,8 +958,14 @@ class Parser(AbstractParser, Base):
     def parse_args(
         self: ParserType, args: Optional[Sequence[str]] = None,
     ) -> ParserType:
-        self._used_env_vars.clear()
-        parser, destinations = self._make_parser()
+        parser, destinations = self._get_parser()
+
+        for values in destinations.values():
+            for _, _, _, action in values:
+                if isinstance(action, ConfigAction):
+                    # Do not reuse the config loaded by the previous call
+                    action._result = None
+
         parsed_ns = parser.parse_args(args)
 
         parsed_value: Any
@@ -785,6 +985,15 @@ class Parser(AbstractParser, Base):
                     action(parser, parsed_ns, parsed_value, None)
                     parsed_value = getattr(parsed_ns, key)
 
+                if (
+                    action is not None and
+                    parsed_value is action.default and
+                    isinstance(parsed_value, list)
+                ):
+                    # The cached parser keeps the same default object
+                    # between calls, so it must not be handed out
+                    parsed_value = list(parsed_value)
+
                 if argument is not None:
                     if argument.secret:
                         parsed_value = SecretString(parsed_value)
@@ -797,7 +1006,7 @@ class Parser(AbstractParser, Base):
         return self
 
     def print_help(self) -> None:
-        parser, _ = self._make_parser()
+        parser, _ = self._get_parser()
         return parser.print_help()
 
     def sanitize_env(self) -> None:
@@ -880,16 +1089,17 @@ def EnumArgument(
     nargs: NargsType = None,
     required: Optional[bool] = None,
 ) -> Any:
+    members: Mapping[str, Any] = enum.__members__
 
     def converter(value: Any) -> EnumMeta:
         if isinstance(value, Enum):
             return value        # type: ignore
-        return enum[value]
+        return members[value]
 
     return TypedArgument(    # type: ignore
         aliases=aliases,
         action=action,
-        choices=sorted(enum.__members__),
+        choices=sorted(members),
         const=const,
         converter=converter,
         default=default,
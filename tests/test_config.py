@@ -63,3 +63,76 @@ def test_config_defaults(tmp_path: Path):
     parser = Parser(config_files=[config_file])
     parser.parse_args([])
     assert parser.foo == "bar"
+
+
+def test_config_reparse(tmp_path: Path):
+    class Parser(argclass.Parser):
+        config = argclass.Config()
+
+    first, second = tmp_path / "first.ini", tmp_path / "second.ini"
+    first.write_text("[DEFAULT]\nfoo = first\n")
+    second.write_text("[DEFAULT]\nfoo = second\n")
+
+    parser = Parser()
+    parser.parse_args(["--config", str(first)])
+    assert parser.config["foo"] == "first"
+
+    parser.parse_args(["--config", str(second)])
+    assert parser.config["foo"] == "second"
+
+
+def test_read_configs_cache(tmp_path: Path):
+    config_file = tmp_path / "config.ini"
+    config_file.write_text("[DEFAULT]\nfoo = bar\n[section]\nspam = egg\n")
+
+    result, filenames = argclass.read_configs(config_file)
+    assert filenames == (config_file.resolve(),)
+    assert result["foo"] == "bar"
+    result["section"]["spam"] = "changed"
+
+    result, _ = argclass.read_configs(config_file)
+    assert result["section"]["spam"] == "egg"
+
+    config_file.write_text("[DEFAULT]\nfoo = modified\n")
+    result, _ = argclass.read_configs(config_file)
+    assert result == {"foo": "modified"}
+
+
+def test_config_files_epilog(tmp_path: Path, capsys: pytest.CaptureFixture):
+    class Parser(argclass.Parser):
+        foo = argclass.Argument(default="spam")
+
+    config_file = tmp_path / "config.ini"
+    config_file.write_text("[DEFAULT]\nfoo = bar\n")
+    missing_file = tmp_path / "missing.ini"
+
+    parser = Parser(
+        config_files=[config_file, missing_file], epilog="Custom epilog.",
+    )
+    parser.print_help()
+    output = " ".join(capsys.readouterr().out.split())
+
+    assert output.index("Custom epilog.") < output.index("Default values")
+    assert "missing.ini" in output
+    assert "Now 1 files has been applied" in output
+    assert output.endswith("https://pypi.org/project/argclass/#configs")
+
+
+def test_config_files_epilog_none(
+    tmp_path: Path, capsys: pytest.CaptureFixture,
+):
+    class Parser(argclass.Parser):
+        foo = argclass.Argument(default="spam")
+
+    Parser(epilog=None).print_help()
+    assert "Default values" not in capsys.readouterr().out
+
+    config_file = tmp_path / "config.ini"
+    config_file.write_text("[DEFAULT]\nfoo = bar\n")
+
+    parser = Parser(config_files=[config_file], epilog=None)
+    parser.print_help()
+    assert "Default values" in capsys.readouterr().out
+
+    parser.parse_args([])
+    assert parser.foo == "bar"
@@ -2,9 +2,10 @@ import json
 import logging
 import os
 import re
+import sys
 import uuid
 from enum import IntEnum
-from typing import FrozenSet, List, Optional
+from typing import FrozenSet, List, Optional, Union
 from unittest.mock import patch
 
 import pytest
@@ -12,6 +13,13 @@ import pytest
 import argclass
 
 
+NO_DIGITS_EXP = re.compile(r"\d+")
+
+
+def random_env_name() -> str:
+    return NO_DIGITS_EXP.sub("", uuid.uuid4().hex + uuid.uuid4().hex).upper()
+
+
 class TestBasics:
     class Parser(argclass.Parser):
         integers: List[int] = argclass.Argument(
@@ -86,6 +94,18 @@ class TestFoo:
         assert parser.grpc.host == "::"
         assert parser.grpc.port == 6000
 
+    def test_group_defaults_copied(self):
+        defaults = {"port": 80}
+
+        class Parser(argclass.Parser):
+            http = HostPortGroup(defaults=defaults)
+
+        defaults["port"] = 8080
+
+        parser = Parser()
+        parser.parse_args(["--http-host=localhost"])
+        assert parser.http.port == 80
+
     def test_parser_repr(self):
         parser = self.Parser()
         r = repr(parser)
@@ -96,26 +116,24 @@ class TestFoo:
         with pytest.raises(AttributeError):
             _ = parser.foo
 
-    def test_environment(self, request: pytest.FixtureRequest):
-        prefix = re.sub(r"\d+", "", uuid.uuid4().hex + uuid.uuid4().hex).upper()
+    def test_environment(self, monkeypatch: pytest.MonkeyPatch):
+        prefix = random_env_name()
         expected = uuid.uuid4().hex
-        os.environ[f"{prefix}_FOO"] = expected
-        request.addfinalizer(lambda: os.environ.pop(f"{prefix}_FOO"))
+        monkeypatch.setenv(f"{prefix}_FOO", expected)
 
         parser = self.Parser(auto_env_var_prefix=f"{prefix}_")
         parser.parse_args([])
         assert parser.foo == expected
 
 
-def test_env_var(request: pytest.FixtureRequest):
-    env_var = re.sub(r"\d+", "", uuid.uuid4().hex + uuid.uuid4().hex).upper()
+def test_env_var(monkeypatch: pytest.MonkeyPatch):
+    env_var = random_env_name()
 
     class Parser(argclass.Parser):
         foo: str = argclass.Argument(env_var=env_var)
 
     expected = uuid.uuid4().hex
-    os.environ[env_var] = expected
-    request.addfinalizer(lambda: os.environ.pop(env_var))
+    monkeypatch.setenv(env_var, expected)
 
     parser = Parser()
     parser.parse_args([])
@@ -187,12 +205,13 @@ def test_print_log_level(capsys: pytest.CaptureFixture):
     assert parser.log_level == logging.WARNING
 
 
-def test_optional_type():
-    class Parser(argclass.Parser):
-        flag: bool
-        optional: Optional[bool]
+class OptionalTypeParser(argclass.Parser):
+    flag: bool
+    optional: Optional[bool]
 
-    parser = Parser()
+
+def test_optional_type():
+    parser = OptionalTypeParser()
     parser.parse_args([])
     assert parser.optional is None
     assert not parser.flag
@@ -200,23 +219,34 @@ def test_optional_type():
     parser.parse_args(["--flag"])
     assert parser.flag
 
-    for variant in ("yes", "Y", "yeS", "enable", "ENABLED", "1"):
-        parser.parse_args([f"--optional={variant}"])
-        assert parser.optional is True
 
-    for variant in ("no", "crap", "false", "disabled", "MY_HANDS_TYPING_WORDS"):
-        parser.parse_args([f"--optional={variant}"])
-        assert parser.optional is False
+@pytest.mark.parametrize(
+    "variant", ("yes", "Y", "yeS", "enable", "ENABLED", "1"),
+)
+def test_optional_type_true(variant):
+    parser = OptionalTypeParser()
+    parser.parse_args([f"--optional={variant}"])
+    assert parser.optional is True
 
 
-def test_argument_defaults():
-    class Parser(argclass.Parser):
-        debug: bool = False
-        confused_default: bool = True
-        pool_size: int = 4
-        forks: int = 2
+@pytest.mark.parametrize(
+    "variant", ("no", "crap", "false", "disabled", "MY_HANDS_TYPING_WORDS"),
+)
+def test_optional_type_false(variant):
+    parser = OptionalTypeParser()
+    parser.parse_args([f"--optional={variant}"])
+    assert parser.optional is False
 
-    parser = Parser()
+
+class ArgumentDefaultsParser(argclass.Parser):
+    debug: bool = False
+    confused_default: bool = True
+    pool_size: int = 4
+    forks: int = 2
+
+
+def test_argument_defaults():
+    parser = ArgumentDefaultsParser()
 
     parser.parse_args([])
     assert parser.debug is False
@@ -247,16 +277,167 @@ def test_inheritance():
     assert parser.port == 9876
 
 
+def test_deep_inheritance():
+    class Level1(argclass.Parser):
+        first: int = 1
+
+    class Level2(Level1):
+        second: str = "two"
+
+    class Level3(Level2):
+        third: bool = False
+
+    class Level4(Level3):
+        fourth: Optional[int]
+
+    parser = Level4()
+    parser.parse_args([])
+    assert parser.first == 1
+    assert parser.second == "two"
+    assert parser.third is False
+    assert parser.fourth is None
+
+    parser.parse_args(["--first=10", "--second=2", "--third", "--fourth=4"])
+    assert parser.first == 10
+    assert parser.second == "2"
+    assert parser.third is True
+    assert parser.fourth == 4
+
+
+def test_reannotated_inherited_argument():
+    class BaseParser(argclass.Parser):
+        foo: int = 1
+        bar: Optional[int]
+        spam: List[int] = argclass.Argument(type=int, nargs="+")
+
+    class Parser(BaseParser):
+        foo: str
+        bar: Optional[str]
+        spam: List[int]
+
+    assert Parser.__arguments__["foo"] is not BaseParser.__arguments__["foo"]
+    assert BaseParser.__arguments__["foo"].type is int
+    assert Parser.__arguments__["foo"].type is str
+    assert Parser.__arguments__["bar"].type is str
+    assert Parser.__arguments__["spam"].type is int
+
+    parser = Parser()
+    parser.parse_args(["--spam", "2"])
+    assert parser.foo == 1
+    assert parser.bar is None
+
+    parser.parse_args(["--foo=abc", "--bar=def", "--spam", "2", "3"])
+    assert parser.foo == "abc"
+    assert parser.bar == "def"
+    assert parser.spam == [2, 3]
+
+
+def test_reannotated_inherited_bool():
+    class BaseParser(argclass.Parser):
+        flag: bool
+        optional: Optional[bool]
+
+    class Parser(BaseParser):
+        flag: Optional[bool]
+        optional: bool
+
+    parser = Parser()
+    parser.parse_args([])
+    assert parser.flag is None
+    assert parser.optional is False
+
+    parser.parse_args(["--flag=no", "--optional"])
+    assert parser.flag is False
+    assert parser.optional is True
+
+    parser = BaseParser()
+    parser.parse_args(["--flag", "--optional=yes"])
+    assert parser.flag is True
+    assert parser.optional is True
+
+
+def test_reannotated_inherited_optional():
+    class BaseParser(argclass.Parser):
+        foo: Optional[int]
+
+    class Parser(BaseParser):
+        foo: int
+
+    assert BaseParser.__arguments__["foo"].required is False
+    assert Parser.__arguments__["foo"].required is True
+
+    parser = Parser()
+    with pytest.raises(SystemExit):
+        parser.parse_args([])
+
+    parser.parse_args(["--foo=1"])
+    assert parser.foo == 1
+
+
+def test_inherited_groups_and_subparsers():
+    class Group(argclass.Group):
+        host: str = "localhost"
+
+    class SubParser(argclass.Parser):
+        count: int = 1
+
+    class BaseParser(argclass.Parser):
+        group = Group()
+        sub = SubParser()
+
+    class Parser(BaseParser):
+        flag: bool
+
+    assert Parser.__arguments__["flag"]
+    assert Parser.__argument_groups__["group"] is BaseParser.group
+    assert Parser.__subparsers__["sub"] is BaseParser.sub
+
+    parser = Parser()
+    parser.parse_args(
+        ["--flag", "--group-host=example.com", "sub", "--count=2"],
+    )
+    assert parser.flag is True
+    assert parser.group.host == "example.com"
+    assert parser.sub.count == 2
+
+
+def test_multiple_inheritance_order():
+    class Group(argclass.Group):
+        host: str = "localhost"
+
+    class SubParser(argclass.Parser):
+        count: int = 1
+
+    class First(argclass.Parser):
+        foo = argclass.Argument(default="first")
+        group = Group(defaults={"host": "first"})
+        sub = SubParser()
+
+    class Second(argclass.Parser):
+        foo = argclass.Argument(default="second")
+        group = Group(defaults={"host": "second"})
+        sub = SubParser()
+
+    class Parser(First, Second):
+        pass
+
+    assert Parser.__arguments__["foo"] is First.__arguments__["foo"]
+    assert Parser.__argument_groups__["group"] is First.group
+    assert Parser.__subparsers__["sub"] is First.sub
+
+    parser = Parser()
+    parser.parse_args([])
+    assert parser.foo == "first"
+    assert parser.group.host == "first"
+
+
 def test_config_for_required(tmp_path):
     class Parser(argclass.Parser):
         required: int = argclass.Argument(required=True)
 
     config_path = tmp_path / "config.ini"
 
-    with open(config_path, "w") as fp:
-        fp.write("[DEFAULT]\n")
-        fp.write("required = 10\n")
-        fp.write("\n")
+    config_path.write_text("[DEFAULT]\nrequired = 10\n\n")
 
     parser = Parser(config_files=[config_path])
     parser.parse_args([])
@@ -283,6 +464,27 @@ def test_minimal_optional(tmp_path):
     assert parser.optional == 10
 
 
+@pytest.mark.skipif(
+    sys.version_info < (3, 10), reason="PEP 604 unions require python 3.10",
+)
+def test_pep604_union_type():
+    class Parser(argclass.Parser):
+        optional: int | None
+        explicit: float | None = argclass.Argument()
+        flag: bool | None
+
+    parser = Parser()
+    parser.parse_args([])
+    assert parser.optional is None
+    assert parser.explicit is None
+    assert parser.flag is None
+
+    parser.parse_args(["--optional=10", "--explicit=0.5", "--flag=yes"])
+    assert parser.optional == 10
+    assert parser.explicit == 0.5
+    assert parser.flag is True
+
+
 def test_optional_is_not_required(tmp_path):
     class Parser(argclass.Parser):
         optional: Optional[int] = argclass.Argument(required=False)
@@ -349,18 +551,18 @@ def test_log_group_defaults():
     assert parser.log.format == "json"
 
 
-def test_environment_required():
+def test_environment_required(monkeypatch: pytest.MonkeyPatch):
     class Parser(argclass.Parser):
         required: int
 
     parser = Parser(auto_env_var_prefix="TEST_")
 
-    os.environ["TEST_REQUIRED"] = "100"
+    monkeypatch.setenv("TEST_REQUIRED", "100")
 
     parser.parse_args([])
     assert parser.required == 100
 
-    os.environ.pop("TEST_REQUIRED")
+    monkeypatch.delenv("TEST_REQUIRED")
 
     with pytest.raises(SystemExit):
         parser.parse_args([])
@@ -410,69 +612,65 @@ def test_nargs_1():
     assert parser.args_set == frozenset([1])
 
 
-def test_nargs_env_var():
+class NargsParser(argclass.Parser):
+    nargs: FrozenSet[int] = argclass.Argument(
+        type=int, nargs="*", converter=frozenset, env_var="NARGS",
+    )
+
+
+def test_nargs_env_var(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("NARGS", "[1, 2, 3]")
+    parser = NargsParser()
+    parser.parse_args([])
+
+    assert parser.nargs == frozenset({1, 2, 3})
+
+
+def test_nargs_env_var_default_not_shared(monkeypatch: pytest.MonkeyPatch):
     class Parser(argclass.Parser):
-        nargs: FrozenSet[int] = argclass.Argument(
-            type=int, nargs="*", converter=frozenset, env_var="NARGS",
+        nargs: List[int] = argclass.Argument(
+            type=int, nargs="*", env_var="NARGS",
         )
 
-    os.environ["NARGS"] = "[1, 2, 3]"
-    try:
-        parser = Parser()
-        parser.parse_args([])
-    finally:
-        del os.environ["NARGS"]
+    monkeypatch.setenv("NARGS", "[1, 2]")
+    parser = Parser()
+    parser.parse_args([])
+    parser.nargs.append(9)
 
-    assert parser.nargs == frozenset({1, 2, 3})
+    parser.parse_args([])
+    assert parser.nargs == [1, 2]
 
 
-def test_nargs_env_var_str():
+def test_nargs_env_var_str(monkeypatch: pytest.MonkeyPatch):
     class Parser(argclass.Parser):
         nargs: FrozenSet[int] = argclass.Argument(
             type=str, nargs="*", converter=frozenset, env_var="NARGS",
         )
 
-    os.environ["NARGS"] = '["a", "b", "c"]'
-    try:
-        parser = Parser()
-        parser.parse_args([])
-    finally:
-        del os.environ["NARGS"]
+    monkeypatch.setenv("NARGS", '["a", "b", "c"]')
+    parser = Parser()
+    parser.parse_args([])
 
     assert parser.nargs == frozenset({"a", "b", "c"})
 
 
 def test_nargs_config_list(tmp_path):
-    class Parser(argclass.Parser):
-        nargs: FrozenSet[int] = argclass.Argument(
-            type=int, nargs="*", converter=frozenset, env_var="NARGS",
-        )
-
     conf_file = tmp_path / "config.ini"
 
-    with open(conf_file, "w") as fp:
-        fp.write("[DEFAULT]\n")
-        fp.write("nargs = [1, 2, 3, 4]\n")
+    conf_file.write_text("[DEFAULT]\nnargs = [1, 2, 3, 4]\n")
 
-    parser = Parser(config_files=[conf_file])
+    parser = NargsParser(config_files=[conf_file])
     parser.parse_args([])
 
     assert parser.nargs == frozenset({1, 2, 3, 4})
 
 
 def test_nargs_config_set(tmp_path):
-    class Parser(argclass.Parser):
-        nargs: FrozenSet[int] = argclass.Argument(
-            type=int, nargs="*", converter=frozenset, env_var="NARGS",
-        )
-
     conf_file = tmp_path / "config.ini"
 
-    with open(conf_file, "w") as fp:
-        fp.write("[DEFAULT]\n")
-        fp.write("nargs = {1, 2, 3, 4}\n")
+    conf_file.write_text("[DEFAULT]\nnargs = {1, 2, 3, 4}\n")
 
-    parser = Parser(config_files=[conf_file])
+    parser = NargsParser(config_files=[conf_file])
     parser.parse_args([])
 
     assert parser.nargs == frozenset({1, 2, 3, 4})
@@ -507,20 +705,41 @@ def test_sanitize_env():
         parser.parse_args([])
         parser.sanitize_env()
 
-        assert "TEST_SECRET" not in dict(os.environ)
+        assert "TEST_SECRET" not in os.environ
 
 
-def test_enum():
-    class Options(IntEnum):
-        ONE = 1
-        TWO = 2
-        THREE = 3
-        ZERO = 0
-
+def test_sanitize_env_reused_parser(monkeypatch: pytest.MonkeyPatch):
     class Parser(argclass.Parser):
-        option: Options = argclass.EnumArgument(Options, default=Options.ZERO)
+        secret: str = argclass.Secret()
 
-    parser = Parser()
+    parser = Parser(auto_env_var_prefix="TEST_")
+
+    for _ in range(2):
+        monkeypatch.setenv("TEST_SECRET", "foo")
+        parser.parse_args([])
+        assert parser.secret == "foo"
+
+        parser.sanitize_env()
+        assert "TEST_SECRET" not in os.environ
+
+
+class Options(IntEnum):
+    ONE = 1
+    TWO = 2
+    THREE = 3
+    ZERO = 0
+
+
+class EnumParser(argclass.Parser):
+    option: Options = argclass.EnumArgument(Options, default=Options.ZERO)
+
+
+class ImplicitEnumParser(argclass.Parser):
+    option: Options
+
+
+def test_enum():
+    parser = EnumParser()
 
     parser.parse_args([])
     assert parser.option is Options.ZERO
@@ -534,10 +753,7 @@ def test_enum():
     with pytest.raises(SystemExit):
         parser.parse_args(["--option=3"])
 
-    class Parser(argclass.Parser):
-        option: Options
-
-    parser = Parser()
+    parser = ImplicitEnumParser()
 
     parser.parse_args(["--option=ONE"])
     assert parser.option is Options.ONE
@@ -592,3 +808,49 @@ def test_json_action(tmp_path):
     parser.parse_args(["--config", str(tmp_path / "config.json")])
 
     assert parser.config["foo"] == "bar"
+
+
+def test_complex_union_raises():
+    for _ in range(2):
+        with pytest.raises(TypeError):
+            class Parser(argclass.Parser):
+                value: Optional[Union[int, str]]
+
+
+def test_parser_reused_between_calls(monkeypatch: pytest.MonkeyPatch):
+    class Parser(argclass.Parser):
+        foo: int = argclass.Argument(env_var="TEST_REUSED_FOO", default=1)
+
+    monkeypatch.delenv("TEST_REUSED_FOO", raising=False)
+    parser = Parser()
+
+    with patch.object(
+        Parser, "_make_parser", autospec=True,
+        side_effect=argclass.Parser._make_parser,
+    ) as make_parser:
+        parser.parse_args([])
+        parser.parse_args(["--foo=2"])
+        assert parser.foo == 2
+        assert make_parser.call_count == 1
+
+        monkeypatch.setenv("TEST_REUSED_FOO", "3")
+        parser.parse_args([])
+        assert parser.foo == 3
+        assert make_parser.call_count == 2
+
+
+def test_nargs_env_var_declared_default(monkeypatch: pytest.MonkeyPatch):
+    class Parser(argclass.Parser):
+        nargs: FrozenSet[int] = argclass.Argument(
+            type=int, nargs="*", converter=frozenset, env_var="NARGS",
+            default=[1, 2],
+        )
+
+    monkeypatch.delenv("NARGS", raising=False)
+    parser = Parser()
+    parser.parse_args([])
+    assert parser.nargs == frozenset({1, 2})
+
+    monkeypatch.setenv("NARGS", "[3, 4]")
+    parser.parse_args([])
+    assert parser.nargs == frozenset({3, 4})
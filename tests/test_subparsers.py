@@ -162,3 +162,32 @@ def test_call() -> None:
     parser.parse_args(["subparser2"])
     parser()
     assert not parser.subparser2._flag
+
+
+def test_shared_subparser_parent() -> None:
+    class SubSubParser(argclass.Parser):
+        pass
+
+    class SubParser(argclass.Parser):
+        subsub = SubSubParser()
+
+    class Parser(argclass.Parser):
+        sub = SubParser()
+
+    first, second = Parser(), Parser()
+    first.parse_args(["sub"])
+    assert first.sub.__parent__ is first
+
+    second.parse_args(["sub"])
+    assert second.sub.__parent__ is second
+
+    first.parse_args(["sub"])
+    assert first.sub.__parent__ is first
+
+    # The chain is complete on the first build and follows the instance
+    for _ in range(2):
+        for parser in (first, second):
+            parser.parse_args(["sub", "subsub"])
+            assert parser.current_subparsers == (
+                parser.sub.subsub, parser.sub, parser,
+            )